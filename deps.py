@@ -1,7 +1,17 @@
 import sys
+import warnings
+import logging
 
 
 def load_packages():
     sys.path.extend([
         "C:/Users/Tom/PycharmProjects/ProjectHVAC"
     ])
+
+
+def silence(user_warnings=True, fluid_log=True):
+    if user_warnings:
+        warnings.filterwarnings('ignore', category=UserWarning)
+    if fluid_log:
+        from hvac.fluids import fluid_logger
+        fluid_logger.setLevel(logging.ERROR)